@@ -83,21 +83,18 @@ def modify(task_id, filename, tasks, new_details = None, new_status = None):
         # Vérifie la tâche modifiée pour l'affichage
         new_task = None
         for t in updated_tasks:
-            if t[0] == old_task[0]:
+            if t.id == old_task[0]:
                 new_task = t
                 break
 
-        if new_task == old_task:
+        if new_task.as_tuple() == old_task:
             print("Aucune modification apportée à la tâche.")
             return
         
         # Réécrit tout le fichier avec les tâches mises à jour
         with open(filename, 'w') as f:
-            for tid, desc, lab, status, dep in updated_tasks:
-                # Gestion des étiquettes et des dépendances
-                labels_str = ",".join(lab) if lab else "None"
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{status};{dep}\n")
+            # Chaque tâche fournit sa ligne sérialisée
+            f.writelines(task.serialize() for task in updated_tasks)
         print(f"Task {task_id} modified.")
 
         # Enregistre les modifications dans l'historique
@@ -134,11 +131,8 @@ def rm(task_id, filename, tasks):
     if found:
         # Réécrit le fichier avec les tâches restantes
         with open(filename, 'w') as f:
-            for tid, desc, lab, status, dep in remaining_tasks:
-                # Gestion des étiquettes et des dépendances
-                labels_str = ",".join(lab) if lab else "None"
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{status};{dep}\n")
+            # Chaque tâche fournit sa ligne sérialisée
+            f.writelines(task.serialize() for task in remaining_tasks)
         print(f"Task {task_id} removed.")
 
         with open("historique.txt", 'a') as h:
@@ -184,11 +178,8 @@ def add_options(task_id, filename, tasks, new_labels = None, id_dep = None):
     if found:
         # Réécrit tout le fichier avec les tâches mises à jour
         with open(filename, 'w') as f:
-            for tid, desc, lab, state, dep in updated_tasks:
-                # Gestion des étiquettes et des dépendances
-                labels_str = ",".join(lab) if lab else "None"
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{state};{dep}\n")
+            # Chaque tâche fournit sa ligne sérialisée
+            f.writelines(task.serialize() for task in updated_tasks)
         print(f"Options added successfully.")
 
         with open("historique.txt", 'a') as h:
@@ -224,10 +215,8 @@ def rmLabel(task_id, filename, tasks):
     if found:
         # Réécrit tout le fichier avec les tâches mises à jour
         with open(filename, 'w') as f:
-            for tid, desc, lab, status, dep in updated_tasks:
-                # Gestion des étiquettes
-                labels_str = ",".join(lab) if lab else "None"
-                f.write(f"{tid};{desc};{labels_str};{status};{dep}\n")
+            # Chaque tâche fournit sa ligne sérialisée
+            f.writelines(task.serialize() for task in updated_tasks)
         print(f"Label removed successfully.")
 
         old_id, old_desc, old_lab, old_status, old_dep = old_task
@@ -268,11 +257,8 @@ def clearLabel(task_id, filename, tasks):
     if found:
         # Réécrit tout le fichier avec les tâches mises à jour
         with open(filename, 'w') as f:
-            for tid, desc, lab, status, dep in updated_tasks:
-                # Gestion des étiquettes et des dépendances
-                labels_str = ",".join(lab) if lab else "None"
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{status};{dep}\n")
+            # Chaque tâche fournit sa ligne sérialisée
+            f.writelines(task.serialize() for task in updated_tasks)
         print(f"All labels removed successfully.")
 
         with open("historique.txt", 'a') as h:
@@ -308,12 +294,8 @@ def rmDep(task_id, filename, tasks):
     if found:
         # Réécrit tout le fichier avec les tâches mises à jour
         with open(filename, 'w') as f:
-            for tid, desc, lab, state, dep in updated_tasks:
-                # Gestion des étiquettes
-                labels_str = ",".join(lab) if lab else "None"
-                # Gestion de la dépendance
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{state};{dep}\n")
+            # Chaque tâche fournit sa ligne sérialisée
+            f.writelines(task.serialize() for task in updated_tasks)
 
         print("Dependence removed successfully.")
 
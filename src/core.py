@@ -10,142 +10,264 @@ ou "ID;Description;None" (pour les tâches sans étiquettes) dans le fichier.
 Rétrocompatibilité: Supporte aussi l'ancien format "ID;Description" (sans étiquettes).
 """
 
+import locale
+import sys
+from dataclasses import dataclass
+from itertools import chain
+from operator import attrgetter, itemgetter
 
-def parse_tasks(tasks):
+# Encodage des fichiers de tâches (celui des écritures en mode texte),
+# utilisé pour décoder les lignes lues en binaire
+_ENCODING = locale.getpreferredencoding(False)
+
+# Statuts autorisés pour une tâche
+_VALID_STATUSES = frozenset(("started", "suspended", "completed", "cancelled"))
+
+# Réponses acceptées aux questions O/N
+_YES_NO = frozenset(("o", "n", "oui", "non"))
+_YES = frozenset(("o", "oui"))
+
+
+@dataclass(slots=True)
+class Task:
+    """
+    Tâche parsée, modifiable en place.
+
+    Attributes:
+        id (int): Identifiant de la tâche
+        description (str): Description de la tâche
+        labels (list[str]): Étiquettes de la tâche, [] si aucune
+        status (str): Statut (started, suspended, completed, cancelled)
+        dependence (int|None): ID de la tâche parente, None si aucune
+
+    Note:
+        Itérable dans l'ordre (id, description, labels, status, dependence),
+        ce qui permet de la dépaqueter comme l'ancien tuple à 5 éléments.
+    """
+
+    id: int
+    description: str
+    labels: list[str]
+    status: str
+    dependence: int | None
+
+    def __iter__(self):
+        return iter((self.id, self.description, self.labels, self.status, self.dependence))
+
+    def as_tuple(self):
+        """Retourne la tâche sous forme de tuple (id, description, labels, status, dependence)."""
+        return (self.id, self.description, self.labels, self.status, self.dependence)
+
+    def serialize(self):
+        """Retourne la ligne du fichier "ID;Description;Labels;Status;Dependence\\n"."""
+        labels_str = ",".join(self.labels) if self.labels else "None"
+        dep = self.dependence if self.dependence is not None else "None"
+        return f"{self.id};{self.description};{labels_str};{self.status};{dep}\n"
+
+
+def parse_tasks(tasks, return_max_id=False, ids_only=False):
     """
     Parse les lignes brutes du fichier en une liste structurée de tâches.
     
     Args:
-        tasks (list): Liste des lignes lues depuis le fichier de tâches
+        tasks (list): Liste des lignes (str, ou bytes/bytearray si le fichier est lu en binaire)
+        return_max_id (bool, optional): Si True, retourne aussi le plus grand ID rencontré
+        ids_only (bool, optional): Si True, ne lit que la colonne des IDs
         
     Returns:
-        list: Liste de tuples (id: int, description: str, labels: list[str], status: str, dependence: int|None) 
+        list: Liste d'objets Task (id: int, description: str, labels: list[str], status: str, dependence: int|None)
               représentant les tâches. Si pas d'étiquettes, labels=[]. Si pas de dépendance, dependence=None.
+        tuple: (parsed_tasks: list, max_id: int) si return_max_id est True (max_id=0 si aucune tâche)
+        Avec ids_only=True, les éléments sont des tuples (id,) au lieu d'objets Task.
         
     Note:
         - Ignore les lignes vides
         - Ignore les lignes mal formatées (sans ';' ou avec ID non numérique)
         - Le format attendu est "ID;Description;Labels;Status;Dependence"
         - Gère la rétrocompatibilité avec les anciens formats
+        - Retourne une liste neuve que l'appelant peut modifier librement
+        - Les lignes en bytes sont découpées sans décodage, seuls les champs texte
+          (description, étiquettes, statut) sont décodés
         
     Exemple:
         >>> parse_tasks(["1;Faire les courses;None;suspended;None", "2;Réviser;Urgent;started;1"])
-        [(1, 'Faire les courses', [], 'suspended', None), (2, 'Réviser', ['Urgent'], 'started', 1)]
+        [Task(id=1, description='Faire les courses', labels=[], status='suspended', dependence=None),
+         Task(id=2, description='Réviser', labels=['Urgent'], status='started', dependence=1)]
     """
-    
+
+    if not return_max_id:
+        return list(iter_tasks(tasks, ids_only))
+
+    # L'ID maximum est suivi pendant le parsing (pas de seconde passe)
+    get_id = itemgetter(0) if ids_only else attrgetter("id")
     parsed_tasks = []
-    for line in tasks:
-        line = line.strip()
-        if line:  # Ignore les lignes vides
-            parts = line.split(";")
-            if len(parts) >= 2:  # Au minimum ID et description
-                try:
-                    tid = int(parts[0])
-                    description = parts[1]
-                    # Gestion des étiquettes (rétrocompatibilité)
-                    if len(parts) >= 3 and parts[2] != "None":
-                        labels = [label.strip() for label in parts[2].split(",") if label.strip()]
-                    else:
-                        labels = []
+    max_id = 0
+    for task in iter_tasks(tasks, ids_only):
+        parsed_tasks.append(task)
+        tid = get_id(task)
+        if tid > max_id:
+            max_id = tid
+    return parsed_tasks, max_id
 
-                    # Gestion statut
-                    if len(parts) >= 4 and parts[3].strip():
-                        status = parts[3].strip()
-                    else:
-                        status = "suspended"
 
-                    # Dépendances
-                    if len(parts) >= 5 and parts[4].strip().isdigit():
-                        dependence = int(parts[4].strip())
-                    else:
-                        dependence = None
-                    
-                    parsed_tasks.append((tid, description, labels, status, dependence))
-                except ValueError:
-                    # Ignore les lignes avec un ID non numérique
-                    continue
+def iter_tasks(tasks, ids_only=False):
+    """
+    Parse les lignes brutes à la demande, une tâche à la fois.
 
-    return parsed_tasks
+    Args:
+        tasks (iterable): Lignes du fichier de tâches (str, ou bytes/bytearray si lu en binaire)
+        ids_only (bool, optional): Si True, ne lit que la colonne des IDs
 
+    Yields:
+        Task: Chaque tâche valide, dans l'ordre des lignes ((id,) avec ids_only=True)
 
-def add(tasks, details, labels = None, status="suspended"):
+    Note:
+        Mêmes règles que parse_tasks, sans construire de liste : adapté aux
+        parcours uniques (max, filtre, tri).
     """
-    Ajoute une nouvelle tâche avec un ID auto-incrémenté.
-    
+
+    lines = iter(tasks)
+    first = next(lines, None)
+    if first is None:
+        return
+
+    # Lignes lues en binaire (bytes ou bytearray) : on découpe directement les octets
+    is_bytes = isinstance(first, (bytes, bytearray))
+    if is_bytes:
+        semicolon, comma, none = b";", b",", b"None"
+    else:
+        semicolon, comma, none = ";", ",", "None"
+
+    for line in chain((first,), lines):
+        # Découpe champ par champ avec partition (pas de liste intermédiaire).
+        # Plus rapide en pratique qu'une expression régulière par ligne ou
+        # qu'un findall sur le fichier entier.
+        tid_s, sep, rest = line.partition(semicolon)
+        if not sep:  # Ignore les lignes vides ou sans ';'
+            continue
+
+        if ids_only:
+            # Seul l'ID est demandé : le reste de la ligne n'est pas analysé
+            try:
+                tid = int(tid_s)
+            except ValueError:
+                continue
+            yield (tid,)
+            continue
+
+        description, sep, rest = rest.partition(semicolon)
+        if not sep:
+            # Ancien format "ID;Description" : la description termine la ligne
+            description = description.rstrip()
+        labels_s, sep, rest = rest.partition(semicolon)
+        if not sep:
+            labels_s = labels_s.rstrip()
+        status_s, _, dep_s = rest.partition(semicolon)
+        dep_s = dep_s.partition(semicolon)[0]
+        status_s = status_s.strip()
+        dep_s = dep_s.strip()
+
+        try:
+            # int() ignore les espaces autour de l'ID
+            tid = int(tid_s)
+            # Dépendances
+            dependence = int(dep_s) if dep_s.isdigit() else None
+        except ValueError:
+            # Ignore les lignes avec un ID non numérique
+            continue
+
+        # Gestion des étiquettes (rétrocompatibilité)
+        if labels_s and labels_s != none:
+            labels = [label.strip() for label in labels_s.split(comma) if label.strip()]
+        else:
+            labels = []
+
+        # Gestion statut
+        status = status_s
+
+        if is_bytes:
+            # Décodage des seuls champs texte
+            description = description.decode(_ENCODING)
+            labels = [label.decode(_ENCODING) for label in labels]
+            status = status.decode(_ENCODING)
+        status = status or "suspended"
+
+        yield Task(tid, description, labels, status, dependence)
+
+
+def _max_existing_id(tasks):
+    """
+    Retourne le plus grand ID présent dans les lignes brutes (0 si aucun).
+
+    Ne lit que la première colonne de chaque ligne, sans parser le reste.
+    """
+
+    return max((t[0] for t in iter_tasks(tasks, ids_only=True)), default=0)
+
+
+def _index_by_id(tasks):
+    """
+    Construit l'index ID -> position dans tasks.
+
+    Si un ID apparaît plusieurs fois, c'est sa première occurrence qui est
+    retenue (comme les anciennes boucles de recherche).
+    """
+
+    index = {}
+    for i, task in enumerate(tasks):
+        index.setdefault(task.id, i)
+    return index
+
+
+def _new_task(new_id, load_tasks, details, labels=None, status="suspended"):
+    """
+    Construit une nouvelle tâche, en demandant interactivement sa dépendance.
+
     Args:
-        tasks (list): Liste des lignes existantes du fichier de tâches
+        new_id (int): ID à attribuer à la nouvelle tâche
+        load_tasks (callable): Retourne (tâches existantes, index ID -> position) ; n'est
+                               appelé que si l'utilisateur veut définir une dépendance
         details (str): Description de la nouvelle tâche
-        labels (list[str], optional): Liste d'étiquette(s) de la nouvelle tâche, None si aucune
+        labels (list[str], optional): Étiquette(s) de la nouvelle tâche, None si aucune
         status (str, optional): Statut initial de la tâche (défaut: "suspended")
-        
+
     Returns:
-        tuple: (new_id: int, description: str, labels: list, task_line: str) ou (None, None, None, None) si annulé
-            - new_id: L'ID assigné à la nouvelle tâche
-            - description: La description de la tâche
-            - labels: Liste des étiquettes, vide si aucune
-            - task_line: La ligne formatée à écrire dans le fichier (format: ID;Description;Labels;Status;Dependence)
-            
-    Note:
-        - L'ID est calculé comme max(IDs existants) + 1
-        - Si aucune tâche n'existe, l'ID commence à 1
-        - L'utilisateur peut définir une dépendance de manière interactive
-        - La ligne retournée inclut le saut de ligne final
-        - Retourne (None, None, None, None) si l'utilisateur annule (Ctrl+C)
-        
-    Example:
-        >>> add(["1;Tâche existante;None;completed;None"], "Nouvelle tâche", ["urgent"], "suspended")
-        (2, 'Nouvelle tâche', ['urgent'], '2;Nouvelle tâche;urgent;suspended;None\n')
+        Task: La nouvelle tâche, ou None si l'utilisateur annule (Ctrl+C)
     """
 
-    # Trouve le prochain ID disponible en analysant les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    if parsed_tasks:
-        # Calcule l'ID maximum et ajoute 1
-        new_id = max(task[0] for task in parsed_tasks) + 1
-    else:
-        # Premier ID si aucune tâche n'existe
-        new_id = 1
-
     # Réécriture de labels
     if labels == None:
         labels_list = []
     else:
         labels_list = labels
-    
-    labels_str = ",".join(labels_list) if labels_list else "None"
-    
+
     # Vérification du statut
-    if status not in ["started", "suspended", "completed", "cancelled"]:
+    if status not in _VALID_STATUSES:
         print(f"Statut '{status}' invalide, utilisation de 'suspended' à la place.")
         status = "suspended"
     print(f"Statut de la nouvelle tâche : {status}")
 
     # Gestion des dépendances
     id_dep = None
-    if parsed_tasks:
+    if new_id > 1:
         try:
             dependence = input("Cette tâche dépend t-elle d'une autre tâche ? O/N : ")
-            while dependence.lower() not in ["o", "n", "oui", "non"]:
+            while dependence.lower() not in _YES_NO:
                 dependence = input("Input invalide, cette tâche dépend t-elle d'une autre tâche ? O/N : ")
 
-            if dependence.lower() in ["oui", "o"]:
+            if dependence.lower() in _YES:
+                parsed_tasks, index = load_tasks()
                 print("Liste des tâches existantes :")
-                id_list = []
                 for (tid, desc, _, state, _) in parsed_tasks:
                     print(f"{tid}: {desc} ({state})")
-                    id_list.append(tid)
 
                 while True:
                     try:
                         id_dep = int(input("Laquelle ? "))
-                        if id_dep in id_list:
+                        if id_dep in index:
                             if status == "started" or status == "completed":
-                                # On cherche le statut de la tâche dépendante
-                                parent_status = "suspended"
-                                for (pid, _, _, pstate, _) in parsed_tasks:
-                                    if pid == id_dep:
-                                        parent_status = pstate
-                                        break
+                                # On récupère le statut de la tâche dépendante
+                                parent_status = parsed_tasks[index[id_dep]].status
                             
                                 if parent_status != "completed":
                                     print(f"La tâche dépendante n'est pas complétée (statut actuel : {parent_status}). La nouvelle tâche sera mise en 'suspended'.")
@@ -157,11 +279,385 @@ def add(tasks, details, labels = None, status="suspended"):
                         print("Erreur : veuillez entrer un nombre valide")
         except KeyboardInterrupt:
             print("\nOpération annulée")
+            return None
+
+    return Task(new_id, details, labels_list, status, id_dep)
+
+
+def _print_tasks(tasks):
+    """
+    Affiche des tâches (objets Task) dans un tableau formaté, triées par ID.
+
+    Voir show() pour le format du tableau.
+    """
+
+    # Trie les tâches par ID croissant
+    sorted_tasks = sorted(tasks, key=attrgetter("id"))
+    if not sorted_tasks:
+        print("No tasks found.")
+        return
+    
+    # Calcule en une seule passe la largeur de chaque colonne,
+    # en partant des largeurs minimales imposées par les en-têtes
+    max_desc_length = 11   # "description"
+    max_lab_length = 12    # "étiquette(s)"
+    max_state_length = 6   # "statut"
+    max_dep_length = 10    # "dépendance"
+    # Chaîne des étiquettes construite une seule fois par ligne,
+    # réutilisée pour la largeur puis pour l'affichage
+    labels_strs = []
+    for _, desc, lab, state, dep in sorted_tasks:
+        if len(desc) > max_desc_length:
+            max_desc_length = len(desc)
+        labels_str = ", ".join(lab) if lab else "None"
+        labels_strs.append(labels_str)
+        if len(labels_str) > max_lab_length:
+            max_lab_length = len(labels_str)
+        if len(state) > max_state_length:
+            max_state_length = len(state)
+        dep_length = len(str(dep)) if dep else 4
+        if dep_length > max_dep_length:
+            max_dep_length = dep_length
+
+    # Construction du tableau
+    border_line = f"+-----+{'-' * (max_desc_length + 2)}+{'-' * (max_lab_length + 2)}+{'-' * (max_state_length + 2)}+{'-' * (max_dep_length + 2)}+"
+    # Gabarit de ligne construit une seule fois avec les largeurs calculées
+    row_format = "| {:<3} | {:<%d} | {:<%d} | {:<%d} | {:<%d} |" % (max_desc_length, max_lab_length, max_state_length, max_dep_length)
+    header_line = row_format.format("id", "description", "étiquette(s)", "statut", "dépendance")
+
+    # Les lignes sont accumulées puis écrites en une seule fois
+    out = [border_line, header_line, border_line]
+
+    # Ligne de chaque tâche
+    for (task_id, description, _, state, dep), labels_str in zip(sorted_tasks, labels_strs):
+        out.append(row_format.format(task_id, description, labels_str, state, dep if dep else "None"))
+
+    out.append(border_line)
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+class TaskStore:
+    """
+    Tâches parsées une seule fois et conservées en mémoire.
+
+    Les opérations modifient directement les tâches et les index, sans
+    reparser le fichier ; flush() réécrit le fichier en fin de session.
+
+    Attributes:
+        tasks (list[Task]): Tâches, dans l'ordre du fichier
+        by_id (dict[int, int]): Index ID -> position dans tasks
+        max_id (int): Plus grand ID existant (0 si aucune tâche)
+        dirty (bool): True si des modifications n'ont pas encore été écrites
+
+    Example:
+        >>> store = TaskStore(["1;Tâche 1;None;completed;None"])
+        >>> store.modify("1", new_status="started")[0]
+        True
+        >>> store.dirty
+        True
+        >>> store.flush("sauvegarde_taches.txt")
+    """
+
+    def __init__(self, tasks=()):
+        """
+        Args:
+            tasks (list): Lignes brutes du fichier de tâches
+        """
+        self.tasks, self.max_id = parse_tasks(tasks, return_max_id=True)
+        self.by_id = _index_by_id(self.tasks)
+        self.dirty = False
+
+    def _find(self, task_id):
+        """Retourne la tâche d'ID task_id, ou None si elle n'existe pas."""
+        i = self.by_id.get(task_id)
+        return None if i is None else self.tasks[i]
+
+    def add(self, details, labels=None, status="suspended"):
+        """Ajoute une nouvelle tâche. Mêmes arguments et retour que add()."""
+        task = _new_task(self.max_id + 1, lambda: (self.tasks, self.by_id), details, labels, status)
+        if task is None:
             return None, None, None, None
 
+        self.by_id[task.id] = len(self.tasks)
+        self.tasks.append(task)
+        self.max_id = task.id
+        self.dirty = True
+        return task.id, task.description, task.labels, task.serialize()
+
+    def modify(self, task_id, new_details=None, new_status=None):
+        """Modifie la description et/ou le statut d'une tâche. Même retour que modify()."""
+
+        # Validation et conversion de l'ID
+        try:
+            task_id = int(task_id)
+        except ValueError:
+            # ID invalide (non numérique)
+            return False, [], None
+
+        task = self._find(task_id)
+        if task is None:
+            return False, self.tasks, None
+
+        # IMPORTANT : On sauvegarde l'ancienne tâche AVANT toute modification
+        old_task = task.as_tuple()
+        dep = task.dependence
+
+        # 1. Mise à jour du statut avec vérification des dépendances
+        if new_status is not None:
+            # Si on essaie de DÉMARRER une tâche qui a une dépendance
+            if new_status == "started" and dep is not None:
+                # On vérifie si la tâche parente existe et est terminée
+                parent = self._find(dep)
+
+                if parent is not None and parent.status != "completed":
+                    print(f"REFUSÉ : La tâche parente (ID {dep}) n'est pas terminée.")
+                    # On ne modifie pas le statut, il reste l'ancien
+                else:
+                    task.status = new_status
+
+            # Si c'est un autre statut valide ou s'il n'y a pas de dépendance
+            elif new_status in _VALID_STATUSES:
+                task.status = new_status
+
+            else:
+                print(f"Statut '{new_status}' invalide, pas de modification.")
+
+        # 2. Mise à jour de la description
+        if new_details is not None:
+            task.description = new_details
+
+        # Statut refusé ou invalide, description identique : rien à réécrire
+        if task.as_tuple() != old_task:
+            self.dirty = True
+        return True, self.tasks, old_task
+
+    def rm(self, task_id):
+        """Supprime une tâche et les dépendances vers celle-ci. Même retour que rm()."""
+
+        # Validation et conversion de l'ID
+        try:
+            task_id = int(task_id)
+        except ValueError:
+            # ID invalide, retourne les tâches non modifiées
+            return False, self.tasks, None
+
+        if task_id not in self.by_id:
+            return False, self.tasks, None
+
+        # En une seule passe : enlève la tâche avec l'ID spécifié et retire
+        # (en place) les dépendances des autres tâches vers celle-ci
+        filtered_tasks = []
+        old_task = None
+        for task in self.tasks:
+            if task.id == task_id:
+                old_task = task.as_tuple()
+            else:
+                if task.dependence == task_id:
+                    task.dependence = None
+                filtered_tasks.append(task)
+
+        # Les positions ont changé : reconstruction de l'index
+        self.tasks = filtered_tasks
+        self.by_id = _index_by_id(filtered_tasks)
+        if task_id == self.max_id:
+            self.max_id = max(self.by_id, default=0)
+        self.dirty = True
+        return True, self.tasks, old_task
+
+    def add_options(self, task_id, labels=None, id_dep=None):
+        """Ajoute des étiquettes et/ou une dépendance. Même retour que add_options()."""
+
+        # Validation et conversion de l'ID
+        try:
+            task_id = int(task_id)
+        except ValueError:
+            return False, [], None
+
+        task = self._find(task_id)
+        if task is None:
+            return False, self.tasks, None
+
+        old_task = task.as_tuple()
+        lab = task.labels
+
+        # Mise à jour des étiquettes : la liste n'est copiée qu'au premier ajout
+        # effectif (old_task garde ainsi l'ancienne liste)
+        if labels is not None:
+            new_lab = lab
+            # Ensemble des étiquettes présentes, pour un test de doublon en O(1)
+            existing = set(lab)
+            for label in labels:
+                if label not in existing:
+                    if new_lab is lab:
+                        new_lab = lab[:]
+                    new_lab.append(label)
+                    existing.add(label)
+            task.labels = new_lab
+
+        # Mise à jour de la dépendance
+        if id_dep is not None:
+            if task.dependence is not None:
+                # Demande à l'utilisateur s'il veut modifier la dépendance
+                print(f"Tâche {task.id} dépend déjà de la tâche {task.dependence}.")
+                modify_dep = input("Voulez-vous modifier la dépendance ? (O/N) : ").lower()
+                while modify_dep not in _YES_NO:
+                    modify_dep = input("Réponse invalide, voulez-vous modifier la dépendance ? (O/N) : ").lower()
+                if modify_dep in _YES:
+                    task.dependence = id_dep
+            else:
+                task.dependence = id_dep
+
+        # Étiquettes toutes en double et dépendance inchangée : rien à réécrire
+        if task.as_tuple() != old_task:
+            self.dirty = True
+        return True, self.tasks, old_task
+
+    def rmLabel(self, task_id):
+        """Supprime une étiquette choisie par l'utilisateur. Même retour que rmLabel()."""
+
+        # Validation et conversion de l'ID
+        try:
+            task_id = int(task_id)
+        except ValueError:
+            # ID invalide (non numérique)
+            return False, [], None
+
+        task = self._find(task_id)
+        if task is None:
+            return False, self.tasks, None
+
+        tid, desc, lab, status, dep = task
+        old_task = (tid, desc, lab[:], status, dep)
+        if lab:
+            print("Étiquettes de la tâche :")
+            for j, label in enumerate(lab):
+                print(f"{j}: {label}")
+
+            # Validation robuste de l'entrée utilisateur
+            while True:
+                try:
+                    n = int(input("Entrez le numéro de l'étiquette à supprimer : "))
+                    if 0 <= n < len(lab):
+                        break
+                    else:
+                        print(f"Le numéro doit être entre 0 et {len(lab)-1}")
+                except ValueError:
+                    print("Erreur : veuillez entrer un nombre valide")
+                except KeyboardInterrupt:
+                    print("\nOpération annulée")
+                    return False, self.tasks, None
+
+            # Suppression de l'étiquette (en place)
+            lab.pop(n)
+            self.dirty = True
+        else:
+            print("Cette tâche n'a pas d'étiquettes à supprimer")
+
+        return True, self.tasks, old_task
+
+    def clearLabel(self, task_id):
+        """Supprime toutes les étiquettes d'une tâche. Même retour que clearLabel()."""
+
+        # Validation et conversion de l'ID
+        try:
+            task_id = int(task_id)
+        except ValueError:
+            # ID invalide (non numérique)
+            return False, [], None
+
+        task = self._find(task_id)
+        if task is None:
+            return False, self.tasks, None
+
+        # Modification de la tâche correspondante
+        old_task = task.as_tuple()
+        task.labels = []
+
+        if task.as_tuple() != old_task:
+            self.dirty = True
+        return True, self.tasks, old_task
+
+    def rmDep(self, task_id):
+        """Supprime la dépendance d'une tâche. Même retour que rmDep()."""
+
+        # Validation et conversion de l'ID
+        try:
+            task_id = int(task_id)
+        except ValueError:
+            # ID invalide (non numérique)
+            return False, [], None
+
+        task = self._find(task_id)
+        if task is None:
+            return False, self.tasks, None
+
+        # Modification de la tâche correspondante
+        old_task = task.as_tuple()
+        task.dependence = None
+
+        if task.as_tuple() != old_task:
+            self.dirty = True
+        return True, self.tasks, old_task
+
+    def show(self):
+        """Affiche les tâches dans un tableau formaté (voir show())."""
+        _print_tasks(self.tasks)
+
+    def flush(self, path):
+        """
+        Réécrit le fichier de tâches avec l'état courant.
+
+        Args:
+            path (str): Chemin vers le fichier de tâches
+        """
+        with open(path, 'w') as f:
+            f.writelines(task.serialize() for task in self.tasks)
+        self.dirty = False
+
+
+def add(tasks, details, labels = None, status="suspended"):
+    """
+    Ajoute une nouvelle tâche avec un ID auto-incrémenté.
+    
+    Args:
+        tasks (list): Liste des lignes existantes du fichier de tâches
+        details (str): Description de la nouvelle tâche
+        labels (list[str], optional): Liste d'étiquette(s) de la nouvelle tâche, None si aucune
+        status (str, optional): Statut initial de la tâche (défaut: "suspended")
+        
+    Returns:
+        tuple: (new_id: int, description: str, labels: list, task_line: str) ou (None, None, None, None) si annulé
+            - new_id: L'ID assigné à la nouvelle tâche
+            - description: La description de la tâche
+            - labels: Liste des étiquettes, vide si aucune
+            - task_line: La ligne formatée à écrire dans le fichier (format: ID;Description;Labels;Status;Dependence)
+            
+    Note:
+        - L'ID est calculé comme max(IDs existants) + 1
+        - Si aucune tâche n'existe, l'ID commence à 1
+        - L'utilisateur peut définir une dépendance de manière interactive
+        - La ligne retournée inclut le saut de ligne final
+        - Retourne (None, None, None, None) si l'utilisateur annule (Ctrl+C)
+        
+    Example:
+        >>> add(["1;Tâche existante;None;completed;None"], "Nouvelle tâche", ["urgent"], "suspended")
+        (2, 'Nouvelle tâche', ['urgent'], '2;Nouvelle tâche;urgent;suspended;None\n')
+    """
+
+    # Trouve le prochain ID disponible (1 si aucune tâche n'existe)
+    new_id = _max_existing_id(tasks) + 1
+
+    def load_tasks():
+        # Le parsing complet n'est nécessaire que pour lister les tâches
+        parsed_tasks = parse_tasks(tasks)
+        return parsed_tasks, _index_by_id(parsed_tasks)
+
+    task = _new_task(new_id, load_tasks, details, labels, status)
+    if task is None:
+        return None, None, None, None
+
     # Formate la ligne pour l'écriture dans le fichier
-    new_task_line = f"{new_id};{details};{labels_str};{status};{id_dep}\n"
-    return (new_id, details, labels_list, new_task_line)
+    return (task.id, task.description, task.labels, task.serialize())
 
 
 def modify(tasks, task_id, new_details = None, new_status = None):
@@ -177,7 +673,7 @@ def modify(tasks, task_id, new_details = None, new_status = None):
     Returns:
         tuple: (found: bool, updated_tasks: list, old_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
+            - updated_tasks: Liste des tâches mises à jour (objets Task)
             - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche
             
     Note:
@@ -188,66 +684,13 @@ def modify(tasks, task_id, new_details = None, new_status = None):
         
     Example:
         >>> modify(["1;Ancienne tâche;None;suspended;None"], "1", "Nouvelle description", "started")
-        (True, [(1, 'Nouvelle description', [], 'started', None)], (1, 'Ancienne tâche', [], 'suspended', None))
+        (True, [Task(id=1, description='Nouvelle description', labels=[], status='started', dependence=None)],
+         (1, 'Ancienne tâche', [], 'suspended', None))
     """
 
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide (non numérique)
-        return False, [], None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    old_task = None
-
-    # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, lab, state, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            # IMPORTANT : On sauvegarde l'ancienne tâche AVANT toute modification
-            old_task = (tid, desc, lab, state, dep)
-            
-            # 1. Mise à jour du statut avec vérification des dépendances
-            if new_status is not None:
-                # Si on essaie de DÉMARRER une tâche qui a une dépendance
-                if new_status == "started" and dep is not None:
-                    # On vérifie si la tâche parente est terminée
-                    parent_completed = False
-                    parent_exists = False
-
-                    for (pid, _, _, pstate, _) in parsed_tasks:
-                        if pid == dep:
-                            parent_exists = True
-                            if pstate == "completed":
-                                parent_completed = True
-                            break
-                    
-                    if parent_exists and not parent_completed:
-                        print(f"REFUSÉ : La tâche parente (ID {dep}) n'est pas terminée.")
-                        # On ne modifie pas 'state', il reste l'ancien
-                    else:
-                        state = new_status
+    return TaskStore(tasks).modify(task_id, new_details, new_status)
+
 
-                # Si c'est un autre statut valide ou s'il n'y a pas de dépendance
-                elif new_status in ["started", "suspended", "completed", "cancelled"]:
-                    state = new_status
-                
-                else:
-                    print(f"Statut '{new_status}' invalide, pas de modification.")
-
-            # 2. Mise à jour de la description
-            if new_details is not None:
-                desc = new_details
-                
-            # On met à jour la ligne dans la liste
-            parsed_tasks[i] = (tid, desc, lab, state, dep)
-            found = True
-            break    
-    
-    return found, parsed_tasks, old_task
-    
 def rm(tasks, task_id):
     """
     Supprime une tâche par son ID et met à jour les dépendances.
@@ -259,7 +702,7 @@ def rm(tasks, task_id):
     Returns:
         tuple: (found: bool, remaining_tasks: list, old_task: tuple)
             - found: True si la tâche a été trouvée et supprimée, False sinon
-            - remaining_tasks: Liste des tâches restantes (tuples à 5 éléments)
+            - remaining_tasks: Liste des tâches restantes (objets Task)
             - old_task: Tuple (id, desc, lab, status, dep) correspondant à la tâche supprimée
             
     Note:
@@ -270,46 +713,13 @@ def rm(tasks, task_id):
         
     Example:
         >>> rm(["1;Tâche 1;None;completed;None", "2;Tâche 2;None;suspended;1"], "1")
-        (True, [(2, 'Tâche 2', [], 'suspended', None)], (1, 'Tâche 1', [], 'completed', None))
+        (True, [Task(id=2, description='Tâche 2', labels=[], status='suspended', dependence=None)],
+         (1, 'Tâche 1', [], 'completed', None))
     """
 
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide, retourne les tâches non modifiées
-        return False, parse_tasks(tasks), None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    original_length = len(parsed_tasks)
-    
-    # Filtre les tâches pour enlever celle avec l'ID spécifié
-    filtered_tasks = []
-    for (tid, desc, lab, status, dep) in parsed_tasks:  
-        if tid != task_id:
-            filtered_tasks.append((tid, desc, lab, status, dep))
-        else:
-            old_task = (tid, desc, lab, status, dep)
-    
-    # Détermine si une tâche a été supprimée
-    found = len(filtered_tasks) < original_length
+    return TaskStore(tasks).rm(task_id)
 
-    final_tasks = []
-
-    if found:
-        # Met à jour les dépendances des autres tâches
-        for (tid, desc, lab, status, dep) in filtered_tasks:
-            if dep == task_id:
-                final_tasks.append((tid, desc, lab, status, None))
-            else:
-                final_tasks.append((tid, desc, lab, status, dep))
-    else:
-        final_tasks = filtered_tasks
-        old_task = None
 
-    return found, filtered_tasks, old_task
-            
 def add_options(tasks, task_id, labels=None, id_dep=None):
     """
     Ajoute une ou plusieurs étiquette(s) et/ou dépendance à une tâche existante.
@@ -323,7 +733,7 @@ def add_options(tasks, task_id, labels=None, id_dep=None):
     Returns:
         tuple: (found: bool, updated_tasks: list, old_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
+            - updated_tasks: Liste des tâches mises à jour (objets Task)
             - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche
             
     Note:
@@ -333,47 +743,8 @@ def add_options(tasks, task_id, labels=None, id_dep=None):
         - Si l'ID n'est pas numérique, retourne (False, [], None)
     """
 
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        return False, [], None
-
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    old_task = None
-
-    for i, (tid, desc, lab, state, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            old_task = (tid, desc, lab, state, dep)
-
-            # Mise à jour des étiquettes
-            if labels is not None:
-                new_lab = lab[:] if lab else []
-                for label in labels:
-                    if label not in new_lab:
-                        new_lab.append(label)
-            else:
-                new_lab = lab
-
-            # Mise à jour de la dépendance
-            if id_dep is not None:
-                if dep is not None:
-                    # Demande à l'utilisateur s'il veut modifier la dépendance
-                    print(f"Tâche {tid} dépend déjà de la tâche {dep}.")
-                    modify_dep = input("Voulez-vous modifier la dépendance ? (O/N) : ").lower()
-                    while modify_dep not in ["o", "n", "oui", "non"]:
-                        modify_dep = input("Réponse invalide, voulez-vous modifier la dépendance ? (O/N) : ").lower()
-                    if modify_dep in ["o", "oui"]:
-                        dep = id_dep
-                else:
-                    dep = id_dep
-
-            parsed_tasks[i] = (tid, desc, new_lab, state, dep)
-            found = True
-            break
+    return TaskStore(tasks).add_options(task_id, labels, id_dep)
 
-    return found, parsed_tasks, old_task
 
 def rmLabel(tasks, task_id):
     """
@@ -386,7 +757,7 @@ def rmLabel(tasks, task_id):
     Returns:
         tuple: (found: bool, updated_tasks: list, old_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
+            - updated_tasks: Liste des tâches mises à jour (objets Task)
             - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche
             
     Note:
@@ -400,52 +771,12 @@ def rmLabel(tasks, task_id):
         >>> rmLabel(["1;Tâche 1;None;suspended;None", "2;Tâche 2;tag1,tag2;started;None"], "2")
         # Affiche: 0: tag1, 1: tag2
         # Utilisateur entre: 0
-        (True, [(1, 'Tâche 1', [], 'suspended', None), (2, 'Tâche 2', ['tag2'], 'started', None)], (2, 'Tâche 2', ['tag1', 'tag2'], 'started', None))
+        (True, [Task(id=1, description='Tâche 1', labels=[], status='suspended', dependence=None),
+                Task(id=2, description='Tâche 2', labels=['tag2'], status='started', dependence=None)],
+         (2, 'Tâche 2', ['tag1', 'tag2'], 'started', None))
     """
-    
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide (non numérique)
-        return False, [], None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    
-    # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, lab, status, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            old_task = (tid, desc, lab[:], status, dep)
-            if lab:
-                print("Étiquettes de la tâche :")
-                for j, label in enumerate(lab):
-                    print(f"{j}: {label}")
-                
-                # Validation robuste de l'entrée utilisateur
-                while True:
-                    try:
-                        n = int(input("Entrez le numéro de l'étiquette à supprimer : "))
-                        if 0 <= n < len(lab):
-                            break
-                        else:
-                            print(f"Le numéro doit être entre 0 et {len(lab)-1}")
-                    except ValueError:
-                        print("Erreur : veuillez entrer un nombre valide")
-                    except KeyboardInterrupt:
-                        print("\nOpération annulée")
-                        return False, parsed_tasks, None
-            
-                # Suppression de l'étiquette
-                lab.pop(n)
-                parsed_tasks[i] = (tid, desc, lab, status, dep)
-            else:
-                print("Cette tâche n'a pas d'étiquettes à supprimer")
-            found = True
-            break
-    
-    return found, parsed_tasks, old_task
+
+    return TaskStore(tasks).rmLabel(task_id)
 
 
 def clearLabel(tasks, task_id):
@@ -459,7 +790,7 @@ def clearLabel(tasks, task_id):
     Returns:
         tuple: (found: bool, updated_tasks: list, old_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
+            - updated_tasks: Liste des tâches mises à jour (objets Task)
             - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche
 
     Note:
@@ -468,29 +799,13 @@ def clearLabel(tasks, task_id):
         
     Example:
         >>> clearLabel(["1;Tâche 1;None;suspended;None", "2;Tâche 2;tag1,tag2;started;None"], "2")
-        (True, [(1, 'Tâche 1', [], 'suspended', None), (2, 'Tâche 2', [], 'started', None)], (2, 'Tâche 2', ['tag1', 'tag2'], 'started', None))
+        (True, [Task(id=1, description='Tâche 1', labels=[], status='suspended', dependence=None),
+                Task(id=2, description='Tâche 2', labels=[], status='started', dependence=None)],
+         (2, 'Tâche 2', ['tag1', 'tag2'], 'started', None))
     """
-    
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide (non numérique)
-        return False, [], None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    
-    # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, lab, status, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            old_task = (tid, desc, lab, status, dep)
-            parsed_tasks[i] = (tid, desc, [], status, dep)
-            found = True
-            break
-    
-    return found, parsed_tasks, old_task
+
+    return TaskStore(tasks).clearLabel(task_id)
+
 
 def rmDep(tasks, task_id):
     """
@@ -503,7 +818,7 @@ def rmDep(tasks, task_id):
     Returns:
         tuple: (found: bool, updated_tasks: list, old_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
+            - updated_tasks: Liste des tâches mises à jour (objets Task)
             - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche avant suppression
 
     Note:
@@ -512,29 +827,13 @@ def rmDep(tasks, task_id):
         
     Example:
         >>> rmDep(["1;Tâche 1;None;completed;None", "2;Tâche 2;tag1;suspended;1"], "2")
-        (True, [(1, 'Tâche 1', [], 'completed', None), (2, 'Tâche 2', ['tag1'], 'suspended', None)], (2, 'Tâche 2', ['tag1'], 'suspended', 1))
+        (True, [Task(id=1, description='Tâche 1', labels=[], status='completed', dependence=None),
+                Task(id=2, description='Tâche 2', labels=['tag1'], status='suspended', dependence=None)],
+         (2, 'Tâche 2', ['tag1'], 'suspended', 1))
     """
 
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide (non numérique)
-        return False, [], None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    
-    # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, lab, state, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            old_task = (tid, desc, lab, state, dep)
-            parsed_tasks[i] = (tid, desc, lab, state, None)
-            found = True
-            break
-    
-    return found, parsed_tasks, old_task
+    return TaskStore(tasks).rmDep(task_id)
+
 
 def show(tasks):
     """
@@ -562,41 +861,5 @@ def show(tasks):
         +-----+-----------------+----------------+----------+------------+
     """
 
-    # Parse et vérifie s'il y a des tâches
-    parsed_tasks = parse_tasks(tasks)
-    if not parsed_tasks:
-        print("No tasks found.")
-        return
-    
-    # Trie les tâches par ID croissant
-    sorted_tasks = sorted(parsed_tasks, key=lambda x: x[0])
-    
-    # Calcule la largeur optimale pour la colonne description
-    max_desc_length = max(len(desc) for _, desc, _, _, _ in sorted_tasks) if sorted_tasks else 10
-    max_desc_length = max(max_desc_length, 11)  # Largeur minimale pour "description"
-    
-    # Calcule la largeur optimale pour la colonne étiquette(s)
-    max_lab_length = max(len(", ".join(lab)) for _, _, lab, _, _ in sorted_tasks) if sorted_tasks else 11
-    max_lab_length = max(max_lab_length, 12)  # Largeur minimale pour "étiquette(s)"
-
-    # Largeur dynamique pour état et dépendance
-    max_state_length = max(len(state) for _, _, _, state, _ in sorted_tasks) if sorted_tasks else 6
-    max_state_length = max(max_state_length, 6)  # Largeur minimale
-
-    max_dep_length = max(len(str(dep)) if dep else 4 for _, _, _, _, dep in sorted_tasks) if sorted_tasks else 4
-    max_dep_length = max(max_dep_length, 10)  # Largeur minimale
-
-    # Construction du tableau
-    border_line = f"+-----+{'-' * (max_desc_length + 2)}+{'-' * (max_lab_length + 2)}+{'-' * (max_state_length + 2)}+{'-' * (max_dep_length + 2)}+"
-    header_line = f"| {'id':<3} | {'description':<{max_desc_length}} | {'étiquette(s)':<{max_lab_length}} | {'statut':<{max_state_length}} | {'dépendance':<{max_dep_length}} |"
-
-    print(border_line)
-    print(header_line)
-    print(border_line)
-    
-    # Affichage de chaque tâche
-    for task_id, description, labels, state, dep in sorted_tasks:
-        labels_str = ", ".join(labels) if labels else "None"
-        print(f"| {task_id:<3} | {description:<{max_desc_length}} | {labels_str:<{max_lab_length}} | {state:<{max_state_length}} | {dep if dep else 'None':<{max_dep_length}} |")
-
-    print(border_line)
\ No newline at end of file
+    # Parse les tâches en flux, directement triées pour l'affichage
+    _print_tasks(iter_tasks(tasks))
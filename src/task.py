@@ -36,9 +36,11 @@ options = create_parser().parse_args()
 
 try:
     # === LECTURE DU FICHIER DE TÂCHES ===
-    # Tente de lire le fichier existant
-    with open(options.file, 'r') as f:
-        tasks = f.readlines()
+    # Tente de lire le fichier existant (en binaire : le parsing découpe
+    # directement les bytes et ne décode que les champs texte).
+    # splitlines() reconnaît \n, \r\n et \r comme en mode texte.
+    with open(options.file, 'rb') as f:
+        tasks = f.read().splitlines()
     
     # === EXÉCUTION DE LA COMMANDE ===
     # Dispatch vers la fonction appropriée selon la commande